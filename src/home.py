@@ -127,16 +127,13 @@ def run():
     # 'avail'
     # avail
 
-    avail_by_day_long = pd.DataFrame(
+    # counts only -- the resident/shift name lists are built later by get_avail_detail,
+    # and only for the days that actually get displayed
+    avail_by_day_long = (
         avail.groupby(['Start','Availability'])['Resident']
         .count()
-        ).join(
-            pd.DataFrame(
-                avail.assign(AvailShift= (avail['Resident'] + ' (' + avail['Shift'] + ')'))
-                    .groupby(['Start','Availability'])['AvailShift']
-                    .agg(lambda g: ', '.join(g))    
-            )
-    ).reset_index()
+        .reset_index()
+    )
 
     # 'avail by day long'
     # avail_by_day_long
@@ -157,32 +154,19 @@ def run():
     # 'Avail by day'
     # avail_by_day
 
-    avail_by_shift = pd.DataFrame(
-        avail.assign(AvailShift= (avail['Resident'] + ' (' + avail['Shift'] + ')'))
-            .groupby(['Start','Availability'])['AvailShift']
-            .agg(lambda g: ', '.join(g))
-            .reset_index()
-            .pivot(index='Availability', columns='Start', values='AvailShift')
-            .reindex(['Day Off','On Shift','Off Service','Free'])
-            .T
-            .reindex(pd.date_range(start_date, end_date, freq='D'))
-            .fillna('None')    
-    )
-
-    # 'Avail by shift'
-    # avail_by_shift
-
     st.markdown('# Best Days')
     st.markdown('The days with the most free residents in the range you selected.')
 
-    # avail_by_shift
-
     best_days = avail_by_day.sort_values(['Available','Free','Day Off','Start'], ascending=[False, True, False, False]).iloc[:3, :].index
     # best_days = cbd.groupby(['Day'])[['Count']].sum().reset_index().sort_values(['Count','Day'], ascending=[False, True])
     # best_days = best_days.iloc[:3, :]
     # best_days
     cols = st.columns(len(best_days))
     titles = ['🥇', '🥈', '🥉']
+
+    # the chart hovers over every day in the range, so build the name lists once
+    # for those days and share them with the best days cards
+    avail_detail = get_avail_detail(avail, avail_by_day_long['Start'].unique())
     for i, c in enumerate(cols):
         d = best_days[i]
 
@@ -193,7 +177,7 @@ def run():
 
         md_str = ''
         for k in ['Day Off','Free','On Shift','Off Service']:
-            md_str += f'**{k}**: {avail_by_shift.loc[d, k]}\n\n'
+            md_str += f'**{k}**: {avail_detail.get((d, k), "None")}\n\n'
         c.markdown(md_str)
 
     # st.write(avail_by_day_long)
@@ -204,7 +188,8 @@ def run():
     st.markdown('A day-by-day look at how many residents are free over the selected date range. Mouse over the graph for more information.')
 
     avail_by_day_long_for_bar = (
-        avail_by_day_long.rename({'Start': 'Day', 'Resident':'Count', 'AvailShift':'Residents'}, axis=1)
+        avail_by_day_long.join(avail_detail, on=['Start','Availability'])
+            .rename({'Start': 'Day', 'Resident':'Count', 'AvailShift':'Residents'}, axis=1)
             .assign(Count= lambda df_: df_['Count'].where(df_['Availability'].isin(['Day Off','Free']), -1*df_['Count']))
     )
     plt = px.bar(avail_by_day_long_for_bar, x='Day', y='Count', color='Availability', hover_data=['Residents'],
@@ -247,6 +232,16 @@ def expand_os_to_days(r : pd.DataFrame):
         .reset_index(drop=True))
     return r
 
+def get_avail_detail(avail : pd.DataFrame, days : Collection[pd.Timestamp]):
+    '''Comma-separated "Resident (Shift)" lists indexed by (Start, Availability), for the given days only.'''
+    avail = avail[avail['Start'].isin(days)]
+    return (
+        (avail['Resident'] + ' (' + avail['Shift'] + ')')
+            .groupby([avail['Start'], avail['Availability']])
+            .agg(', '.join)
+            .rename('AvailShift')
+    )
+
 def get_busy_counts(g : pd.DataFrame, sel_res : Collection[str], start_time : datetime.time, end_time : datetime.time):
     day_off_res = set(sel_res) - set(g['Resident'].unique())
     day_off_shifts = ['Off'] * len(day_off_res)